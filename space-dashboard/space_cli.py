@@ -0,0 +1,354 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import shlex
+import sys
+import tempfile
+from datetime import datetime
+
+# command line access to the eight space_functions queries.
+# pandas (via space_functions) is only imported when a query actually needs the csv. with --snapshot it is
+# only imported to parse date arguments that aren't YYYY-MM-DD (see parse_date). dash/plotly are never imported.
+# answers go to stdout, one-off load warnings and errors go to stderr.
+#
+# examples:
+#   python space_cli.py GetSuccessRate NASA
+#   python space_cli.py --build-snapshot snapshot.json
+#   python space_cli.py --snapshot snapshot.json GetMissionsByYear 2000
+#   python space_cli.py --snapshot snapshot.json --batch queries.txt     (one query per line, - for stdin)
+#   python space_cli.py --check                                          (csv vs snapshot answers, see below)
+#
+# a snapshot records the (path, mtime_ns, size) of the csv it was built from and is refused once that csv changes.
+
+#same default as space_functions.DATA_FILE, kept here so --snapshot can check it without importing pandas
+DATA_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "space_missions.csv")
+
+# argument types for each query, args that don't convert are passed through so the function prints its own warning
+QUERIES = {
+    "GetMissionCountByCompany": (str,),
+    "GetSuccessRate": (str,),
+    "GetMissionsByDateRange": (str, str),
+    "GetTopCompaniesByMissionCount": (int,),
+    "GetMissionStatusCount": (),
+    "GetMissionsByYear": (int,),
+    "GetMostUsedRocket": (),
+    "GetAverageMissionsPerYear": (int, int),
+}
+
+
+def convert_args(query_name, raw_args):
+    arg_types = QUERIES[query_name]
+    if len(raw_args) != len(arg_types):
+        raise ValueError(f"{query_name} takes {len(arg_types)} argument(s), got {len(raw_args)}.")
+
+    converted = []
+    for arg_type, raw in zip(arg_types, raw_args):
+        try:
+            converted.append(arg_type(raw))
+        except ValueError:
+            converted.append(raw)
+    return converted
+
+
+def load_space_functions(csv_path=None):
+    #heavy import happens here, only once a csv query is actually run
+    import space_functions
+
+    if csv_path:
+        space_functions.DATA_FILE = os.path.abspath(csv_path)
+    return space_functions
+
+
+def preload_csv(csv_path=None):
+    #load and validate the csv once up front so its one-off warnings go to stderr, not in between the answers
+    space_functions = load_space_functions(csv_path)
+    with contextlib.redirect_stdout(sys.stderr):
+        space_functions.load_data()
+    return space_functions
+
+
+def csv_version(csv_path):
+    stat = os.stat(csv_path)
+    return [os.path.abspath(csv_path), stat.st_mtime_ns, stat.st_size]
+
+
+# --------------------------------------- SNAPSHOT QUERIES (no pandas) ---------------------------------------
+# these are copies of the checks and warnings of the functions in space_functions.py and MUST be kept in sync
+# with them by hand. after changing either side run `python space_cli.py --check`, which runs every query
+# (with good and bad inputs) on both paths and fails if the answers or printed warnings differ.
+
+def parse_date(value):
+    #plain YYYY-MM-DD is parsed here, anything else goes to pd.to_datetime so both paths accept the same input
+    try:
+        return datetime.strptime(value, "%Y-%m-%d")
+    except ValueError:
+        import pandas as pd
+        return pd.to_datetime(value)
+
+
+def snapshot_GetMissionCountByCompany(snapshot, companyName):
+    count = snapshot["company_counts"].get(companyName, 0)
+    if count == 0:
+        print(f"Warning: '{companyName}' is not a valid company name.")
+    return count
+
+
+def snapshot_GetSuccessRate(snapshot, companyName):
+    numTotal = snapshot["company_counts"].get(companyName, 0)
+    if numTotal == 0:
+        print(f"Warning: '{companyName}' is not a valid company name.")
+        return 0.0
+
+    numSuccess = snapshot["company_success"].get(companyName, 0)
+    return round((numSuccess / numTotal) * 100, 5)
+
+
+def snapshot_GetMissionsByDateRange(snapshot, startDate, endDate):
+    try:
+        starting = parse_date(startDate)
+        ending = parse_date(endDate)
+    except Exception:
+        print(f"Warning: inputted start date '{startDate}' or inputted end date '{endDate}' is invalid. Please try again.")
+        return []
+
+    if starting > ending:
+        print(f"Warning: inputted start date '{startDate}' is after the end date '{endDate}'. Please try again.")
+        return []
+
+    return [mission for date, mission in snapshot["dated_missions"] if starting <= datetime.fromisoformat(date) <= ending]
+
+
+def snapshot_GetTopCompaniesByMissionCount(snapshot, n):
+    if not isinstance(n, int) or n <= 0:
+        print(f"Warning: n must be a positive integer. You inputted: {n}.")
+        return []
+
+    return [tuple(entry) for entry in snapshot["ranked_companies"][:n]]
+
+
+def snapshot_GetMissionStatusCount(snapshot):
+    possible_statuses = ["Success", "Failure", "Partial Failure", "Prelaunch Failure"]
+    return {status: snapshot["status_counts"].get(status, 0) for status in possible_statuses}
+
+
+def snapshot_GetMissionsByYear(snapshot, year):
+    if not isinstance(year, int) or year < 0:
+        print(f"Warning: inputted year must be a positive integer. You entered: {year}. Please try again.")
+        return 0
+    if year < 1957:
+        print(f"Warning: The first mission launched in 1957. Please input a year that is 1957 or later. You entered: {year}. Please try again.")
+        return 0
+
+    return snapshot["year_counts"].get(str(year), 0)
+
+
+def snapshot_GetMostUsedRocket(snapshot):
+    if not snapshot["most_used_rocket"]:
+        print("Warning: no data on rockets has been found.")
+    return snapshot["most_used_rocket"]
+
+
+def snapshot_GetAverageMissionsPerYear(snapshot, startYear, endYear):
+    if not (isinstance(startYear, int) and isinstance(endYear, int)):
+        print(f"Warning: the starting year and ending year must be integers. You inputted: {repr(startYear)} ({type(startYear).__name__}), {repr(endYear)} ({type(endYear).__name__}). Please try again.")
+        return 0.0
+    if startYear > endYear:
+        print(f"Warning: inputted start year '{repr(startYear)}' is after the end year '{repr(endYear)}'. Please try again.")
+        return 0.0
+    if startYear < 1957:
+        print(f"Warning: The first mission launched in 1957. Please input a year that is 1957 or later. You entered: {repr(startYear)}. Please try again.")
+        return 0.0
+
+    missions_range = sum(count for year, count in snapshot["year_counts"].items() if startYear <= int(year) <= endYear)
+    years_count = endYear - startYear + 1
+    return round(missions_range / years_count, 5)
+
+
+# -------------------------------------------------- RUNNER --------------------------------------------------
+
+def run_query(query_line, snapshot=None, csv_path=None):
+    parts = shlex.split(query_line)
+    if not parts:
+        return None
+
+    query_name, raw_args = parts[0], parts[1:]
+    if query_name not in QUERIES:
+        raise ValueError(f"unknown query '{query_name}'. Choose from: {', '.join(QUERIES)}.")
+
+    args = convert_args(query_name, raw_args)
+    if snapshot is not None:
+        return globals()[f"snapshot_{query_name}"](snapshot, *args)
+    return getattr(load_space_functions(csv_path), query_name)(*args)
+
+
+# queries --check runs when none are given. same inputs as the test code at the bottom of space_functions.py,
+# plus the date formats where datetime and pandas parsing differ.
+CHECK_QUERIES = [
+    'GetMissionCountByCompany NASA',
+    'GetMissionCountByCompany "Tyler, the Creator"',
+    'GetMissionCountByCompany " "',
+    'GetSuccessRate NASA',
+    'GetSuccessRate "RVSN USSR"',
+    'GetSuccessRate "Tyler, the Creator"',
+    'GetMissionsByDateRange 1957-01-01 1958-06-15',
+    'GetMissionsByDateRange 2019-01-01 2019-12-31',
+    'GetMissionsByDateRange 1957 1958',
+    'GetMissionsByDateRange 10/04/1957 1958-01-01',
+    'GetMissionsByDateRange 19570101 1958-01-01T12:00',
+    'GetMissionsByDateRange 2019-W01-1 2019-02-01',
+    'GetMissionsByDateRange 1951-01-01 1950-01-01',
+    'GetMissionsByDateRange NASA "US Navy"',
+    'GetMissionsByDateRange " " " "',
+    'GetTopCompaniesByMissionCount 4',
+    'GetTopCompaniesByMissionCount 2.5',
+    'GetTopCompaniesByMissionCount 0',
+    'GetTopCompaniesByMissionCount -1',
+    'GetTopCompaniesByMissionCount NASA',
+    'GetMissionStatusCount',
+    'GetMissionsByYear 1940',
+    'GetMissionsByYear -1957',
+    'GetMissionsByYear 1957',
+    'GetMissionsByYear 2000',
+    'GetMissionsByYear 0',
+    'GetMostUsedRocket',
+    'GetAverageMissionsPerYear 1960 1970',
+    'GetAverageMissionsPerYear 1940 1977',
+    'GetAverageMissionsPerYear 2002 1980',
+    'GetAverageMissionsPerYear NASA AMBA',
+    'GetAverageMissionsPerYear 0 1',
+    'GetAverageMissionsPerYear 1957 2022',
+    'GetAverageMissionsPerYear 2010 2020',
+]
+
+
+def build_csv_snapshot(csv_path=None):
+    space_functions = preload_csv(csv_path)
+    data = space_functions.load_data()
+    if data.empty:
+        raise ValueError("the csv has no usable rows, no snapshot was built.")
+
+    snapshot = space_functions.build_query_snapshot(data)
+    snapshot["version"] = list(space_functions.load_validation_report()["version"])
+    return snapshot
+
+
+def write_snapshot(snapshot, snapshot_path):
+    #write next to the target and swap it in, so a failed write never leaves a truncated snapshot behind
+    directory = os.path.dirname(os.path.abspath(snapshot_path))
+    with tempfile.NamedTemporaryFile("w", dir=directory, suffix=".tmp", delete=False) as f:
+        temp_path = f.name
+        try:
+            json.dump(snapshot, f)
+        except BaseException:
+            f.close()
+            os.remove(temp_path)
+            raise
+    os.replace(temp_path, snapshot_path)
+
+
+def load_snapshot(snapshot_path, csv_path=None):
+    with open(snapshot_path) as f:
+        snapshot = json.load(f)
+
+    #cheap os.stat check so a snapshot never silently answers for an older csv
+    current_csv = os.path.abspath(csv_path or DATA_FILE)
+    if not os.path.exists(current_csv):
+        print(f"Warning: {current_csv} not found, can't check that {snapshot_path} is up to date.", file=sys.stderr)
+    elif snapshot.get("version") != csv_version(current_csv):
+        raise ValueError(f"{snapshot_path} was not built from the current {current_csv}. Rebuild it with --build-snapshot.")
+    return snapshot
+
+
+def capture_query(query_line, snapshot=None, csv_path=None):
+    #answer plus everything the query printed, errors count as answers so both paths can be compared
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        try:
+            result = run_query(query_line, snapshot, csv_path)
+        except Exception as error:
+            result = f"{type(error).__name__}: {error}"
+    return result, output.getvalue()
+
+
+def run_check(query_lines, snapshot, csv_path=None):
+    mismatches = 0
+    for query_line in query_lines:
+        csv_answer = capture_query(query_line, None, csv_path)
+        snapshot_answer = capture_query(query_line, snapshot)
+        if csv_answer != snapshot_answer:
+            mismatches += 1
+            print(f"MISMATCH {query_line.strip()}\n  csv:      {csv_answer!r}\n  snapshot: {snapshot_answer!r}")
+
+    print(f"{len(query_lines) - mismatches}/{len(query_lines)} queries match between the csv and the snapshot.")
+
+    #the validation stage has its own inline-csv checks in space_functions
+    validation_ok = load_space_functions(csv_path).check_validation()
+    print(f"validation checks {'passed' if validation_ok else 'FAILED'}.")
+    return 1 if mismatches or not validation_ok else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run space_functions queries from the command line.")
+    parser.add_argument("query", nargs="*", help="query name followed by its arguments, e.g. GetSuccessRate NASA")
+    parser.add_argument("--batch", metavar="FILE", help="file with one query per line (- reads stdin)")
+    parser.add_argument("--snapshot", metavar="FILE", help="answer from a prebuilt snapshot instead of the csv (no pandas)")
+    parser.add_argument("--build-snapshot", metavar="FILE", help="write a snapshot of the csv to FILE and exit")
+    parser.add_argument("--csv", metavar="FILE", help="csv to load instead of space_missions.csv")
+    parser.add_argument("--check", action="store_true",
+                        help="run the queries (or a built-in set) on both the csv and a snapshot and compare the answers")
+    args = parser.parse_args(argv)
+
+    if args.build_snapshot:
+        try:
+            write_snapshot(build_csv_snapshot(args.csv), args.build_snapshot)
+        except (OSError, ValueError) as error:
+            print(f"Error: {error}", file=sys.stderr)
+            return 1
+        return 0
+
+    query_lines = []
+    if args.query:
+        query_lines.append(shlex.join(args.query))
+    if args.batch:
+        try:
+            batch_file = sys.stdin if args.batch == "-" else open(args.batch)
+            with batch_file:
+                query_lines.extend(line for line in batch_file if line.strip() and not line.lstrip().startswith("#"))
+        except (OSError, ValueError) as error:
+            print(f"Error: {error}", file=sys.stderr)
+            return 1
+    if args.check and not query_lines:
+        query_lines = CHECK_QUERIES
+    if not query_lines:
+        parser.error("no query given. Pass one on the command line or use --batch.")
+
+    snapshot = None
+    try:
+        if args.snapshot:
+            snapshot = load_snapshot(args.snapshot, args.csv)
+        elif args.check:
+            snapshot = build_csv_snapshot(args.csv)
+    except (OSError, ValueError) as error:
+        print(f"Error: {error}", file=sys.stderr)
+        return 1
+
+    if args.check or snapshot is None:
+        preload_csv(args.csv)
+    if args.check:
+        return run_check(query_lines, snapshot, args.csv)
+
+    exit_code = 0
+    for query_line in query_lines:
+        try:
+            print(run_query(query_line, snapshot, args.csv))
+        except Exception as error:
+            #report and keep going so one bad query doesn't stop the rest of the batch
+            print(f"Error: {query_line.strip()}: {type(error).__name__}: {error}", file=sys.stderr)
+            exit_code = 1
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
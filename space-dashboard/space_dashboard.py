@@ -7,7 +7,9 @@ from space_functions import (
     GetMissionsByYear,
     GetMostUsedRocket,
     GetAverageMissionsPerYear,
-    load_data
+    load_data,
+    build_company_snapshot,
+    prewarm_company_snapshots
    )
 
 import dash
@@ -48,10 +50,29 @@ fig_company.update_layout(
 )
 
 #VIS 2 - create success over time line graph
-data['Date'] = pd.to_datetime(data['Date'], errors='coerce')
-
+#Date is already parsed and validated by load_data()
 data['Year'] = data['Date'].dt.year #year only
 
+#precompute per-company bundles in the background, the dropdown callbacks read from here.
+#data is loaded once per process and the whole layout (table, dropdown options, slider, figures) is built from it,
+#so the bundles only need building at startup. a changed csv is picked up by restarting the app.
+company_snapshots = {}
+company_names = set(data['Company'].unique())
+prewarm_company_snapshots(data, company_snapshots)
+
+def get_company_snapshot(company):
+    key = company if company else "All"
+    snapshot = company_snapshots.get(key)
+    if snapshot is None:
+        if key != "All" and key not in company_names:
+            #dash doesn't check dropdown values against the options, so don't cache made-up names
+            return build_company_snapshot(data.iloc[0:0])
+        #not prewarmed yet, build it now and keep it
+        company_data = data if key == "All" else data[data['Company'] == key]
+        snapshot = build_company_snapshot(company_data)
+        company_snapshots[key] = snapshot
+    return snapshot
+
 #success rate per year (lambda function?)
 success_rate_per_year = (
     data.groupby('Year')['MissionStatus']
@@ -328,19 +349,12 @@ dcc.Dropdown(
     Input('year-range-slider', 'value')
 )
 def update_success_chart(selected_company, selected_years):
-    filtered_data = data.copy()
-    if selected_company:
-        filtered_data = filtered_data[filtered_data['Company'] == selected_company]
-    
-    filtered_data = filtered_data[
-        (filtered_data['Year'] >= selected_years[0]) &
-        (filtered_data['Year'] <= selected_years[1])
-    ]
-    
-    success_rate_per_year = (
-        filtered_data.groupby('Year')['MissionStatus']
-        .apply(lambda x: (x == 'Success').sum() / len(x) * 100)
-        .reset_index(name='SuccessRate')
+    yearly_success = get_company_snapshot(selected_company)["yearly_success"]
+
+    success_rate_per_year = pd.DataFrame(
+        [(year, rate) for year, rate in yearly_success.items()
+         if selected_years[0] <= year <= selected_years[1]],
+        columns=['Year', 'SuccessRate']
     )
     
     fig = px.line(
@@ -394,16 +408,11 @@ def update_slider_text(year_range, selected_company):
     Input("pie-company-dropdown", "value")
 )
 def update_pie(selected_company):
-    #begin with full dataset to be filtered
-    df_filtered = data.copy()
-
-    #filter by company if a specific one is selected
-    if selected_company and selected_company != "All":
-        df_filtered = df_filtered[df_filtered["Company"] == selected_company]
-
-    #count outcomes
-    outcome_counts = df_filtered["MissionStatus"].value_counts().reset_index()
-    outcome_counts.columns = ["Outcome", "Count"]
+    #outcome counts come from the precomputed company bundle
+    outcome_counts = pd.DataFrame(
+        list(get_company_snapshot(selected_company)["outcome_counts"].items()),
+        columns=["Outcome", "Count"]
+    )
 
     #pie chart
     fig = px.pie(
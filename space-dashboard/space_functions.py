@@ -1,16 +1,110 @@
+import contextlib
+import io
+import os
+import tempfile
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 
 # convert to dashboard after using dash by plotly? (look into software)
 
+#csv sits next to this file so the functions work from any folder. space_cli.py can point this somewhere else.
+DATA_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "space_missions.csv")
+
+EXPECTED_COLUMNS = ["Company", "Location", "Date", "Time", "Rocket", "Mission", "RocketStatus", "Price", "MissionStatus"]
+REQUIRED_VALUES = ["Company", "Date", "Rocket", "Mission", "MissionStatus"]
+MISSION_STATUSES = ["Success", "Failure", "Partial Failure", "Prelaunch Failure"]
+
+#validated dataset, rebuilt only when DATA_FILE or its modification time/size changes
+_dataset_cache = {"version": None, "data": None, "quarantine": None, "report": None}
+
+
+# validation - one vectorized pass over the raw csv. returns (clean rows, quarantined rows with reasons, report).
+# clean rows come back with Date as datetime and Price as float so nothing downstream has to coerce again.
+def validate_data(raw: pd.DataFrame, source: str = "space_missions.csv"):
+    missing_columns = [column for column in EXPECTED_COLUMNS if column not in raw.columns]
+    if missing_columns:
+        raise ValueError(f"{source} is missing column(s): {', '.join(missing_columns)}.")
+
+    dates = pd.to_datetime(raw['Date'], format = "%Y-%m-%d", errors = 'coerce')
+    times = pd.to_datetime(raw['Time'], format = "%H:%M:%S", errors = 'coerce')
+    prices = pd.to_numeric(raw['Price'].astype("string").str.replace(",", "", regex = False), errors = 'coerce').astype(float)
+
+    #one boolean mask per reason, a row can fail more than one
+    checks = {f"missing {column}": raw[column].isna() for column in REQUIRED_VALUES}
+    checks["bad Date"] = dates.isna() & raw['Date'].notna()
+    checks["bad Time"] = times.isna() & raw['Time'].notna()
+    checks["bad Price"] = prices.isna() & raw['Price'].notna()
+    checks["unknown MissionStatus"] = ~raw['MissionStatus'].isin(MISSION_STATUSES) & raw['MissionStatus'].notna()
+    checks["duplicate row"] = raw.duplicated(keep = 'first')
+
+    failed = pd.DataFrame(checks)
+    bad_rows = failed.any(axis = 1)
+
+    data = raw.assign(Date = dates, Price = prices)[~bad_rows].reset_index(drop = True)
+
+    quarantine = raw[bad_rows].copy()
+    quarantine_checks = failed[bad_rows]
+    quarantine['Reason'] = quarantine_checks.dot(quarantine_checks.columns + "; ").str.rstrip("; ")
+
+    report = {
+        "rows": len(raw),
+        "clean_rows": len(data),
+        "quarantined_rows": len(quarantine),
+        "failures": {reason: int(count) for reason, count in failed.sum().items() if count},
+    }
+    return data, quarantine, report
+
+
+# empty frame with the same columns and dtypes as a validated dataset, returned when the csv can't be loaded
+def _empty_dataset() -> pd.DataFrame:
+    data = pd.DataFrame({column: pd.Series(dtype = object) for column in EXPECTED_COLUMNS})
+    return data.astype({"Date": "datetime64[ns]", "Price": float})
+
+
 def load_data():
-    #load the space_missions.csv file and return as a DataFrame
+    #load the csv at DATA_FILE, validated once per version of the file (failures included), and return as a DataFrame
     try:
-        data = pd.read_csv("space_missions.csv")
-        return data
-    
+        stat = os.stat(DATA_FILE)
+        version = (DATA_FILE, stat.st_mtime_ns, stat.st_size)
     except FileNotFoundError:
-        print("Error: space_missions.csv not found in the project folder.")
-        return pd.DataFrame()  # <-- load empty DataFrame named pd.
+        version = (DATA_FILE, None, None)
+
+    if _dataset_cache["version"] != version:
+        file_name = os.path.basename(DATA_FILE)
+        try:
+            data, quarantine, report = validate_data(pd.read_csv(DATA_FILE), file_name)
+            if len(quarantine):
+                print(f"Warning: {len(quarantine)} row(s) in {file_name} failed validation and were quarantined: {report['failures']}")
+
+        except FileNotFoundError:
+            error = f"{file_name} not found in {os.path.dirname(DATA_FILE)}."
+            print(f"Error: {error}")
+            data, quarantine, report = _empty_dataset(), None, {"error": error}
+
+        except ValueError as error:
+            print(f"Error: {error}")
+            data, quarantine, report = _empty_dataset(), None, {"error": str(error)}
+
+        if quarantine is None:
+            quarantine = _empty_dataset().assign(Reason = pd.Series(dtype = object))
+            report = dict(report, rows = 0, clean_rows = 0, quarantined_rows = 0, failures = {})
+        _dataset_cache.update(version = version, data = data, quarantine = quarantine, report = report)
+
+    #shallow copy so callers adding columns don't touch the cached frame
+    return _dataset_cache["data"].copy(deep = False)
+
+
+# rows load_data() left out, with a Reason column. goes through load_data() so it matches the current csv.
+def load_quarantine() -> pd.DataFrame:
+    load_data()
+    return _dataset_cache["quarantine"].copy(deep = False)
+
+
+# summary of the last validation pass (row counts, failures per reason, and the (path, mtime_ns, size) version it ran on).
+# goes through load_data() so it matches the current csv. if the csv couldn't be loaded the counts are 0 and "error" says why.
+def load_validation_report() -> dict:
+    load_data()
+    return dict(_dataset_cache["report"], version = _dataset_cache["version"])
 
 
 # f1 - returns the total number of missions for a given company
@@ -45,7 +139,6 @@ def GetSuccessRate(companyName: str) -> float:
 # f3 - returns a list of all mission names launched between startDate and endDate (inclusive)
 def GetMissionsByDateRange(startDate: str, endDate: str) -> list:
     data = load_data()
-    data['Date'] = pd.to_datetime(data['Date'], errors = 'coerce')
     try:
         starting = pd.to_datetime(startDate)
         ending = pd.to_datetime(endDate)
@@ -58,7 +151,7 @@ def GetMissionsByDateRange(startDate: str, endDate: str) -> list:
         return []
 
     missions_within_range = data[(data['Date'] >= starting) & (data['Date'] <= ending)]
-    missions_within_range_list = missions_within_range.sort_values('Date')['Mission'].tolist()   
+    missions_within_range_list = missions_within_range.sort_values('Date', kind = 'mergesort')['Mission'].tolist()   
     return missions_within_range_list
 
 
@@ -84,12 +177,10 @@ def GetTopCompaniesByMissionCount(n: int) -> list:
 def GetMissionStatusCount() -> dict:
     data = load_data()
 
-    possible_statuses = ["Success", "Failure", "Partial Failure", "Prelaunch Failure"]
-
     status_count = data['MissionStatus'].value_counts()
     mission_status_count = {}
 
-    for current_status in possible_statuses:
+    for current_status in MISSION_STATUSES:
         mission_status_count[current_status] = int(status_count.get(current_status, 0))
 
     return mission_status_count
@@ -106,7 +197,6 @@ def GetMissionsByYear(year: int) -> int:
         print(f"Warning: The first mission launched in 1957. Please input a year that is 1957 or later. You entered: {year}. Please try again.")
         return 0
 
-    data['Date'] = pd.to_datetime(data['Date'], errors = 'coerce')
     missions_in_year = data[data['Date'].dt.year == year]
 
     return len(missions_in_year)
@@ -143,7 +233,6 @@ def GetAverageMissionsPerYear(startYear: int, endYear: int) -> float:
         return 0.0
     
 
-    data['Date'] = pd.to_datetime(data['Date'], errors = 'coerce')
 
     missions_range = data[(data['Date'].dt.year >= startYear) & (data['Date'].dt.year <= endYear)]
 
@@ -154,6 +243,158 @@ def GetAverageMissionsPerYear(startYear: int, endYear: int) -> float:
 
     return round(avg, 5)
 
+# snapshots - precomputed per-company bundles so the dashboard callbacks don't re-filter the full frame every time
+def build_company_snapshot(company_data: pd.DataFrame, top_n_rockets: int = 5) -> dict:
+    dates = company_data['Date']
+    is_success = company_data['MissionStatus'] == "Success"
+
+    #yearly success rate (%) keyed by year, same numbers as the line graph
+    yearly_success = ( is_success.groupby(dates.dt.year).mean() * 100 )
+    yearly_success_dict = {int(year): float(rate) for year, rate in yearly_success.items()}
+
+    #value_counts keeps the descending order the pie chart expects
+    outcome_counts = {status: int(count) for status, count in company_data['MissionStatus'].value_counts().items()}
+
+    rocket_count = company_data['Rocket'].value_counts()
+    rocket_count = rocket_count.sort_index(kind = 'mergesort').sort_values(ascending = False, kind = 'mergesort')
+    top_rockets = [(rocket, int(count)) for rocket, count in rocket_count.head(top_n_rockets).items()]
+
+    first_launch = dates.min()
+    last_launch = dates.max()
+
+    return {
+        "yearly_success": yearly_success_dict,
+        "outcome_counts": outcome_counts,
+        "top_rockets": top_rockets,
+        "first_launch": None if pd.isna(first_launch) else first_launch.strftime("%Y-%m-%d"),
+        "last_launch": None if pd.isna(last_launch) else last_launch.strftime("%Y-%m-%d"),
+    }
+
+
+# fills store with one bundle per company (plus "All" for the whole dataset) using a thread pool.
+# returns right away, bundles land in store as they finish. callbacks should fall back to build_company_snapshot on a miss.
+def prewarm_company_snapshots(data: pd.DataFrame, store: dict, max_workers=None) -> ThreadPoolExecutor:
+    executor = ThreadPoolExecutor(max_workers = max_workers, thread_name_prefix = "snapshot")
+
+    def _build_into_store(company, company_data):
+        store[company] = build_company_snapshot(company_data)
+
+    executor.submit(_build_into_store, "All", data)
+    for company, company_data in data.groupby('Company'):
+        executor.submit(_build_into_store, company, company_data)
+
+    executor.shutdown(wait = False)
+    return executor
+
+# snapshot of everything the eight query functions need, as plain json-friendly types.
+# space_cli.py answers from this without importing pandas.
+def build_query_snapshot(data: pd.DataFrame) -> dict:
+    dated = data.sort_values('Date', kind = 'mergesort')
+
+    company_counts = data['Company'].value_counts()
+    company_success = data[data['MissionStatus'] == "Success"]['Company'].value_counts()
+    #same ordering as GetTopCompaniesByMissionCount
+    ranked_companies = company_counts.sort_index(kind = 'mergesort').sort_values(ascending = False)
+
+    #same tie-break as GetMostUsedRocket (alphabetical among the most used)
+    rocket_count = data['Rocket'].value_counts()
+    most_used_rocket = "" if rocket_count.empty else sorted(rocket_count[rocket_count == rocket_count.max()].index)[0]
+
+    return {
+        "company_counts": {company: int(count) for company, count in company_counts.items()},
+        "company_success": {company: int(count) for company, count in company_success.items()},
+        "ranked_companies": [[company, int(count)] for company, count in ranked_companies.items()],
+        "status_counts": {status: int(count) for status, count in data['MissionStatus'].value_counts().items()},
+        "year_counts": {str(int(year)): int(count) for year, count in data['Date'].dt.year.value_counts().items()},
+        "most_used_rocket": most_used_rocket,
+        "dated_missions": [[date.strftime("%Y-%m-%d"), mission] for date, mission in zip(dated['Date'], dated['Mission'])],
+    }
+
+# checks - small inline csvs through validate_data, load_data, load_quarantine and load_validation_report.
+# prints each failed check and returns True if everything passed. run from the test code below or space_cli.py --check.
+def check_validation() -> bool:
+    global DATA_FILE
+    problems = []
+    header = ",".join(EXPECTED_COLUMNS)
+    good_row = 'NASA,"LC-39A, Kennedy Space Center, Florida, USA",1969-07-16,13:32:00,Saturn V,Apollo 11,Retired,"1,160.0",Success'
+
+    #(row, expected Reason or None if the row should stay)
+    cases = [
+        (good_row, None),
+        (good_row, "duplicate row"),
+        ('NASA,"LC-39A",1969-13-45,13:32:00,Saturn V,Bad Date,Retired,,Success', "bad Date"),
+        ('NASA,"LC-39A",1969-07-16,25:99,Saturn V,Bad Time,Retired,,Success', "bad Time"),
+        ('NASA,"LC-39A",1969-07-16,13:32:00,Saturn V,Bad Price,Retired,lots,Success', "bad Price"),
+        ('NASA,"LC-39A",1969-07-16,13:32:00,Saturn V,Bad Status,Retired,,Kaboom', "unknown MissionStatus"),
+        (',"LC-39A",1969-07-16,noon,Saturn V,Two Reasons,Retired,,Failure', "missing Company; bad Time"),
+        ('NASA,"LC-39A",1969-07-17,,Saturn V,No Time Or Price,Retired,,Failure', None),
+    ]
+    csv_text = "\n".join([header] + [row for row, _ in cases]) + "\n"
+    expected_reasons = [reason for _, reason in cases if reason]
+
+    data, quarantine, report = validate_data(pd.read_csv(io.StringIO(csv_text)), "inline.csv")
+    if quarantine['Reason'].tolist() != expected_reasons:
+        problems.append(f"validate_data reasons: {quarantine['Reason'].tolist()} != {expected_reasons}")
+    if len(data) != 2 or report["clean_rows"] != 2 or report["quarantined_rows"] != len(expected_reasons):
+        problems.append(f"validate_data row counts: {len(data)} clean, report {report}")
+    if not pd.api.types.is_datetime64_any_dtype(data['Date']) or data['Price'].iloc[0] != 1160.0 or not pd.isna(data['Price'].iloc[1]):
+        problems.append(f"validate_data parsing: Date {data['Date'].dtype}, Price {data['Price'].tolist()}")
+    if report["failures"] != {"missing Company": 1, "bad Date": 1, "bad Time": 2, "bad Price": 1, "unknown MissionStatus": 1, "duplicate row": 1}:
+        problems.append(f"validate_data failures: {report['failures']}")
+
+    try:
+        validate_data(pd.read_csv(io.StringIO("Company,Date\nNASA,1969-07-16\n")), "inline.csv")
+        problems.append("validate_data accepted a csv with missing columns")
+    except ValueError as error:
+        if "inline.csv is missing column(s): Location, Time, Rocket" not in str(error):
+            problems.append(f"validate_data missing column message: {error}")
+
+    #same csvs through DATA_FILE, restoring the real file and cache afterwards
+    saved_file, saved_cache = DATA_FILE, dict(_dataset_cache)
+    with tempfile.TemporaryDirectory() as folder:
+        good_path = os.path.join(folder, "good.csv")
+        bad_path = os.path.join(folder, "bad.csv")
+        with open(good_path, "w") as f:
+            f.write(csv_text)
+        with open(bad_path, "w") as f:
+            f.write("Company,Date\nNASA,1969-07-16\n")
+
+        try:
+            DATA_FILE = good_path
+            printed = io.StringIO()
+            with contextlib.redirect_stdout(printed):
+                loaded = load_data()
+                quarantined = load_quarantine()
+                loaded_report = load_validation_report()
+            if len(loaded) != 2 or quarantined['Reason'].tolist() != expected_reasons:
+                problems.append(f"load_data/load_quarantine: {len(loaded)} rows, reasons {quarantined['Reason'].tolist()}")
+            if loaded_report["version"][0] != good_path or loaded_report["quarantined_rows"] != len(expected_reasons):
+                problems.append(f"load_validation_report: {loaded_report}")
+            if printed.getvalue().count("good.csv failed validation") != 1:
+                problems.append(f"load_data warning: {printed.getvalue()!r}")
+
+            DATA_FILE = bad_path
+            printed = io.StringIO()
+            with contextlib.redirect_stdout(printed):
+                loaded = load_data()
+                year_count = GetMissionsByYear(2000)
+                loaded_report = load_validation_report()
+            if list(loaded.columns) != EXPECTED_COLUMNS or not pd.api.types.is_datetime64_any_dtype(loaded['Date']) or year_count != 0:
+                problems.append(f"load_data on a bad csv: columns {list(loaded.columns)}, GetMissionsByYear {year_count}")
+            if "bad.csv is missing column(s)" not in loaded_report.get("error", ""):
+                problems.append(f"load_validation_report on a bad csv: {loaded_report}")
+            if printed.getvalue().count("Error:") != 1:
+                problems.append(f"bad csv error should print once: {printed.getvalue()!r}")
+
+        finally:
+            DATA_FILE = saved_file
+            _dataset_cache.update(saved_cache)
+
+    for problem in problems:
+        print(f"FAILED: {problem}")
+    return not problems
+
+
 #note to enzo to double check. all functions outputting a float must round to 5 decimal places, not 2.
 # --------------------------------------------- TEST CODE -------------------------------------------------
 '''
@@ -212,4 +453,8 @@ print(GetAverageMissionsPerYear(0, 1))
 print(GetAverageMissionsPerYear(1957, 2022))
 print(GetAverageMissionsPerYear(2010, 2020))
 print(GetAverageMissionsPerYear("2000", "2015")) #type: ignore
+
+# test code for the validation stage
+
+print(check_validation())
 '''
\ No newline at end of file